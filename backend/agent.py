@@ -1,24 +1,86 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from typing import List, Optional
-from uuid import uuid4
-
+import os
+import re
+import secrets
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Any, Coroutine, List, Optional, Tuple
+
+import httpx
+import orjson
 from google.adk.agents import LlmAgent
 from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.events import Event, EventActions
+from google.adk.models import Gemini
+from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
-from pydantic import BaseModel
-
-from .types import AgentResponse, ChatRequest, Message, PromoData, TransferState, VALID_COUNTRIES, VALID_METHODS, COUNTRY_CURRENCY_MAP
+from google.adk.sessions import InMemorySessionService, Session
+from google.genai import Client, types
+from redis.asyncio import Redis
+
+from .cache import ResponseCache
+from .history import InMemoryHistoryStore, RedisHistoryStore, format_message
+from .intents import (
+    CONFIRM_REPLIES,
+    GREETING_REPLIES,
+    RESET_REPLIES,
+    detect_intent,
+)
+from .promo import PROMO_BY_LANG
+from .sessions import RedisSessionService
+from .streaming import AgentResponseStream
+from .types import AgentOutput, AgentResponse, ChatRequest, TransferState, VALID_COUNTRIES, VALID_METHODS, COUNTRY_CURRENCY_MAP
 
 logger = logging.getLogger("send_money_agent")
 
-PROMO_IMAGE_URL = "https://cdn.prod.website-files.com/663002023d3d42ffa6937084/692e0e7ee90ceebca6e1077c_home-troca.avif"
-PROMO_LINK = "https://www.felixpago.com"
+AGENT_NAME = "send_money_agent"
+# Flash handles turns where at least FLASH_MIN_FILLED_FIELDS fields are
+# filled or (likely) provided by the message, i.e. the turns that can
+# complete, summarize or confirm a transfer; the faster Flash-Lite handles
+# the rest of the field collection
+MODEL_NAME = "gemini-2.5-flash"
+LITE_MODEL_NAME = "gemini-2.5-flash-lite"
+FLASH_MIN_FILLED_FIELDS = 3
+# Summarizes messages that roll off the prompt's history window
+SUMMARY_MODEL_NAME = LITE_MODEL_NAME
+SUMMARY_MAX_OUTPUT_TOKENS = 64
+SUMMARY_STATE_KEY = "transfer:summary"
+# Keep-alive pool of the shared google-genai client
+GENAI_MAX_KEEPALIVE_CONNECTIONS = 100
+GENAI_KEEPALIVE_EXPIRY_SECONDS = 60
+# The system prompt is registered once as cached content and re-created
+# shortly before it expires, so it is never re-prefilled per request.
+SYSTEM_CACHE_TTL_SECONDS = 3600
+SYSTEM_CACHE_REFRESH_MARGIN_SECONDS = 300
+
+# Sessions live in Redis when REDIS_URL is set, otherwise in process memory
+REDIS_URL = os.getenv("REDIS_URL")
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "3600"))
+# Exact-match response cache (Redis only)
+RESPONSE_CACHE_TTL_SECONDS = 3600
+
+# Replies are short JSON; the promo card is attached server-side
+MAX_OUTPUT_TOKENS = 256
+
+# Set by process_message for the duration of an agent run; the after-model
+# callback resolves it with the parsed response
+_pending_response: ContextVar[Optional[asyncio.Future[AgentResponse]]] = ContextVar(
+    "pending_response", default=None
+)
+
+# Cheap hints that a message provides a field; names cannot be spotted this way
+_COUNTRY_HINT_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(country) for country in VALID_COUNTRIES) + r")\b",
+    re.IGNORECASE,
+)
+_AMOUNT_HINT_RE = re.compile(r"\d")
+_METHOD_HINT_RE = re.compile(r"\b(?:bank|cash|wallet|deposit|pickup)\b", re.IGNORECASE)
 
 SYSTEM_INSTRUCTION = f"""
 You are a helpful, professional, and friendly Send Money Agent.
@@ -31,7 +93,7 @@ Your goal is to collect the following information from the user to initiate a mo
 VALIDATION DATA (Strictly enforce these):
 - Supported Countries: {", ".join(VALID_COUNTRIES)}
 - Supported Delivery Methods: {", ".join(VALID_METHODS)}
-- Currency Mapping: {json.dumps(COUNTRY_CURRENCY_MAP)}
+- Currency Mapping: {orjson.dumps(COUNTRY_CURRENCY_MAP).decode()}
 - Beneficiary Name: Must consist of at least TWO words (First Name and Last Name).
 
 LANGUAGE & LOCALIZATION:
@@ -40,7 +102,7 @@ LANGUAGE & LOCALIZATION:
 - If the user writes in English (e.g., "hi", "hello", "I want to send money"), respond in English.
 - If the user writes in Portuguese (e.g., "oi", "olá", "quero enviar dinheiro"), respond in Portuguese.
 - Do NOT infer language from conversation history or previous messages - only use the current user message.
-- If the user speaks Portuguese, the entire 'agentResponse' AND the 'promo' text (if applicable) must be in Portuguese.
+- If the user speaks Portuguese, the entire 'agentResponse' must be in Portuguese.
 - Internal State Mapping: If the user provides a value in their language (e.g., "Brasil", "Alemanha"), map it to the corresponding English value from VALIDATION DATA (e.g., "Brazil", "Germany") for the 'updatedState' JSON.
 
 STRICT ENTITY GUARDRAILS (Crucial to prevent confusion):
@@ -79,43 +141,129 @@ If (and ONLY if):
 2. The user explicitly CONFIRMS the transaction (e.g., "Yes", "Correct", "Ok", "Send").
 THEN:
 1. Respond with a polite closing message confirming the transaction is processing.
-2. INCLUDE the 'promo' object in the JSON response.
-3. TRANSLATE the promo content to the user's language based on this English Template:
-   - Title: "Send money home and enter to win a Ford F-150 XL"
-   - Description: "All your transfers in December of $100 or more enter the draw."
-   - Button: "Send and participate now"
-   - Footer: "T&Cs apply. Promotion not valid for NY and FL."
-   - Image URL: "{PROMO_IMAGE_URL}" (Do not translate URL)
-   - Link: "{PROMO_LINK}" (Do not translate URL)
+2. Set 'promoLanguage' to the language of the user's latest message: "en", "pt" or "es" (use "en" for any other language). The promo card is added by the system - do NOT write promo text.
 
-If the transaction is NOT confirmed or NOT complete, 'promo' must be null.
+If the transaction is NOT confirmed or NOT complete, 'promoLanguage' must be null.
 
 - Do NOT hallucinate values.
+
+OUTPUT FORMAT: Emit compact JSON on a single line, with no whitespace or line breaks between tokens.
 """
 
 
-class PromptContext(BaseModel):
+SUMMARY_PROMPT = """Summarize this money-transfer chat in at most 40 tokens, keeping only facts the agent still needs (what the user asked for, corrections, open questions).
+
+Previous summary: {summary}
+
+Newer messages:
+{messages}
+"""
+
+
+@lru_cache(maxsize=256)
+def _state_json(values: Tuple[Any, ...]) -> str:
+    fields = dict(zip(TransferState.model_fields, values))
+    return TransferState.model_construct(**fields).model_dump_json(indent=2)
+
+
+def render_state(state: TransferState) -> str:
+    """Pretty-printed state JSON, memoized on the (hashable) field values."""
+    return _state_json(tuple(getattr(state, name) for name in TransferState.model_fields))
+
+
+_PROMPT_TEMPLATE = (
+    "Current Internal State:\n"
+    "{state}\n\n"
+    "Conversation History:\n"
+    "{history}\n\n"
+    "User's Latest Input:\n"
+    "\"{msg}\""
+)
+
+
+@dataclass(slots=True)
+class PromptContext:
+    # Plain dataclass: every field is already validated by the time it gets here
     user_message: str
     state: TransferState
-    history: List[Message]
+    history: List[str]
+    summary: Optional[str] = None
 
     def render(self) -> str:
-        history_text = "\n".join(
-            f"{msg.role.upper()}: {msg.content}" for msg in self.history[-10:]
-        ) or "No previous messages."
-
-        return (
-            "Current Internal State:\n"
-            f"{json.dumps(self.state.model_dump(), indent=2)}\n\n"
-            "Conversation History:\n"
-            f"{history_text}\n\n"
-            "User's Latest Input:\n"
-            f"\"{self.user_message}\""
-        )
+        history_text = "\n".join(self.history) or "No previous messages."
+        if self.summary:
+            history_text = f"Summary of earlier turns: {self.summary}\n{history_text}"
+
+        return _PROMPT_TEMPLATE.format_map({
+            "state": render_state(self.state),
+            "history": history_text,
+            "msg": self.user_message,
+        })
+
+
+@lru_cache(maxsize=1)
+def get_genai_client() -> Client:
+    """
+    Shared google-genai client (reads GEMINI_API_KEY / GOOGLE_API_KEY), created
+    on first use. Its async transport is a single HTTP/2 keep-alive pool, so
+    concurrent requests are multiplexed and later ones skip TCP/TLS setup.
+    """
+    return Client(
+        http_options=types.HttpOptions(
+            async_client_args={
+                "http2": True,
+                "limits": httpx.Limits(
+                    max_keepalive_connections=GENAI_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=GENAI_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            },
+        ),
+    )
+
+
+class PooledGemini(Gemini):
+    """Gemini model that uses the shared client instead of creating its own."""
+
+    @cached_property
+    def api_client(self) -> Client:
+        return get_genai_client()
+
+
+def prepare_llm_request(
+    callback_context: CallbackContext,
+    llm_request: LlmRequest,
+) -> Optional[LlmResponse]:
+    """
+    Gemini rejects requests that set both cached_content and system_instruction.
+    The ADK always adds a short identity instruction, so drop it whenever the
+    system prompt is served from the cache.
+    """
+    if llm_request.config and llm_request.config.cached_content:
+        llm_request.config.system_instruction = None
+    return None
+
+
+def response_state_delta(response: AgentResponse) -> dict[str, Any]:
+    """
+    session.state entries for an agent response. Uses the 'transfer:' prefix
+    to organize the state; promo is cleared (None) when absent.
+    """
+    delta: dict[str, Any] = {
+        f"transfer:{key}": value
+        for key, value in response.updatedState.model_dump().items()
+    }
+    delta["transfer:last_response"] = response.agentResponse
+    delta["transfer:promo"] = response.promo.model_dump_json() if response.promo else None
+    return delta
 
 
 def create_state_update_callback():
-    """Callback that updates session.state after the LLM model responds"""
+    """
+    Callback that updates session.state after the LLM model responds.
+    The parsed AgentResponse is also handed to the waiting process_message
+    call through the _pending_response ContextVar, so the session does not
+    need to be re-read afterwards.
+    """
     async def on_after_model_call(
         callback_context: CallbackContext,
         llm_response: LlmResponse,
@@ -126,105 +274,369 @@ def create_state_update_callback():
         """
         if not llm_response or not llm_response.content or not llm_response.content.parts:
             return None
+        # Streamed chunks are partial JSON; only the aggregated response is parsed
+        if llm_response.partial:
+            return None
         
         # Extract text from the response
         response_text = "".join(
             part.text or "" for part in llm_response.content.parts if part.text
         )
         
+        pending = _pending_response.get()
+
         try:
-            # Parse JSON returned by the LLM
-            data = json.loads(response_text)
-            agent_response_obj = AgentResponse(**data)
-            
-            # Update session.state with the new state
-            # Uses 'transfer:' prefix to organize the state
-            state_dict = agent_response_obj.updatedState.model_dump()
-            for key, value in state_dict.items():
-                callback_context.state[f"transfer:{key}"] = value
+            # Parse and validate the JSON returned by the LLM in one pass
+            output = AgentOutput.model_validate_json(response_text)
+            agent_response_obj = AgentResponse(
+                agentResponse=output.agentResponse,
+                updatedState=output.updatedState,
+                promo=(
+                    PROMO_BY_LANG[output.promoLanguage]
+                    if output.promoLanguage and output.updatedState.isComplete
+                    else None
+                ),
+            )
             
-            # Save agent response and promo (if present)
-            callback_context.state["transfer:last_response"] = agent_response_obj.agentResponse
-            if agent_response_obj.promo:
-                callback_context.state["transfer:promo"] = json.dumps(agent_response_obj.promo.model_dump())
-            else:
-                if "transfer:promo" in callback_context.state:
-                    try:
-                        del callback_context.state["transfer:promo"]
-                    except KeyError:
-                        pass
+            # Update session.state with the new state in a single batch
+            callback_context.state.update(response_state_delta(agent_response_obj))
             
+            if pending is not None and not pending.done():
+                pending.set_result(agent_response_obj)
             # Return None to keep the original LLM response
             return None
-        except (json.JSONDecodeError, Exception) as e:
+        except Exception as e:
             # If parsing fails, keep the original response
             logger.warning("Could not parse LLM response as JSON: %s", e, exc_info=True)
             logger.warning("Response text (first 500 chars): %s", response_text[:500])
+            if pending is not None and not pending.done():
+                pending.set_exception(e)
             return None
     
     return on_after_model_call
 
 
+def create_agent(model: str) -> LlmAgent:
+    return LlmAgent(
+        name=AGENT_NAME,
+        model=PooledGemini(model=model),
+        instruction=SYSTEM_INSTRUCTION,
+        include_contents="none",
+        output_schema=AgentOutput,
+        generate_content_config=types.GenerateContentConfig(
+            temperature=0.1,
+            response_mime_type="application/json",
+            max_output_tokens=MAX_OUTPUT_TOKENS,
+            # Short structured replies do not benefit from thinking tokens,
+            # which would also count against max_output_tokens
+            thinking_config=types.ThinkingConfig(thinking_budget=0),
+        ),
+        before_model_callback=prepare_llm_request,
+        # Callback to update state automatically
+        after_model_callback=create_state_update_callback(),
+    )
+
+
 class SendMoneyAgentService:
     def __init__(self) -> None:
-        self._agent = LlmAgent(
-            name="send_money_agent",
-            model="gemini-2.5-flash",
-            instruction=SYSTEM_INSTRUCTION,
-            include_contents="none",
-            output_schema=AgentResponse,
-            generate_content_config=types.GenerateContentConfig(
-                temperature=0.1,
-                response_mime_type="application/json",
-            ),
-            # Callback to update state automatically
-            after_model_callback=create_state_update_callback(),
-        )
+        self._agent_flash = create_agent(MODEL_NAME)
+        self._agent_lite = create_agent(LITE_MODEL_NAME)
         self._app_name = "send-money-service"
         self._user_id = "web-client"
         # Create session_service as class attribute for reuse
-        self._session_service = InMemorySessionService()
-
-    async def process_message(
-        self, 
-        payload: ChatRequest,
-        session_id: Optional[str] = None
-    ) -> AgentResponse:
+        self._redis: Optional[Redis] = (
+            Redis.from_url(REDIS_URL, decode_responses=True) if REDIS_URL else None
+        )
+        self._session_service = (
+            RedisSessionService(self._redis, ttl_seconds=SESSION_TTL_SECONDS)
+            if self._redis is not None
+            else InMemorySessionService()
+        )
+        self._runner_flash = Runner(
+            agent=self._agent_flash,
+            app_name=self._app_name,
+            session_service=self._session_service,
+        )
+        self._runner_lite = Runner(
+            agent=self._agent_lite,
+            app_name=self._app_name,
+            session_service=self._session_service,
+        )
+        self._history = (
+            RedisHistoryStore(self._redis, ttl_seconds=SESSION_TTL_SECONDS)
+            if self._redis is not None
+            else InMemoryHistoryStore()
+        )
+        self._response_cache = ResponseCache(self._redis, ttl_seconds=RESPONSE_CACHE_TTL_SECONDS)
+        # LLM calls in progress, keyed by the hash of their rendered prompt
+        self._inflight: dict[str, asyncio.Future[Optional[AgentResponse]]] = {}
+        # Keeps fire-and-forget tasks referenced until they finish
+        self._background_tasks: set[asyncio.Task[Any]] = set()
+        # Latest summary task per session; each new one waits for it
+        self._summary_tasks: dict[str, asyncio.Task[None]] = {}
+        # Cached content holding SYSTEM_INSTRUCTION, per model (absent = inline)
+        self._cached_system: dict[str, str] = {}
+        self._cache_refresh_task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def _agents(self) -> Tuple[LlmAgent, LlmAgent]:
+        return self._agent_flash, self._agent_lite
+
+    async def start(self) -> None:
+        """Register the system prompt as cached content and keep it fresh."""
+        await asyncio.gather(*(self._refresh_system_cache(agent) for agent in self._agents))
+        self._cache_refresh_task = asyncio.create_task(self._keep_system_cache_fresh())
+
+    async def stop(self) -> None:
+        if self._cache_refresh_task is not None:
+            self._cache_refresh_task.cancel()
+            self._cache_refresh_task = None
+        for agent in self._agents:
+            cache_name = self._cached_system.get(agent.canonical_model.model)
+            if cache_name is None:
+                continue
+            self._use_system_cache(agent, None)
+            try:
+                await get_genai_client().aio.caches.delete(name=cache_name)
+            except Exception as e:
+                logger.warning("Could not delete cached system instruction: %s", e)
+        # Let pending summaries and cache writes finish before Redis goes away
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    async def _keep_system_cache_fresh(self) -> None:
+        while True:
+            await asyncio.sleep(SYSTEM_CACHE_TTL_SECONDS - SYSTEM_CACHE_REFRESH_MARGIN_SECONDS)
+            await asyncio.gather(*(self._refresh_system_cache(agent) for agent in self._agents))
+
+    async def _refresh_system_cache(self, agent: LlmAgent) -> None:
         """
-        Process a user message.
-        
-        Args:
-            payload: Request data
-            session_id: Session ID (if None, creates new session)
+        Create a new cache for SYSTEM_INSTRUCTION and switch the agent to it.
+        Caches are per model. The previous cache is left to expire on its own
+        so in-flight requests that still reference it keep working. On
+        failure the agent falls back to sending the instruction inline.
         """
-        # Use provided session_id or create new one
-        if session_id is None:
-            session_id = str(uuid4())
-        
-        # Get or create session
+        try:
+            cache = await get_genai_client().aio.caches.create(
+                model=agent.canonical_model.model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=SYSTEM_INSTRUCTION,
+                    ttl=f"{SYSTEM_CACHE_TTL_SECONDS}s",
+                ),
+            )
+        except Exception as e:
+            logger.warning(
+                "Could not cache system instruction for %s, sending it inline: %s",
+                agent.canonical_model.model,
+                e,
+            )
+            self._use_system_cache(agent, None)
+            return
+        self._use_system_cache(agent, cache.name)
+
+    def _use_system_cache(self, agent: LlmAgent, cache_name: Optional[str]) -> None:
+        if cache_name:
+            self._cached_system[agent.canonical_model.model] = cache_name
+        else:
+            self._cached_system.pop(agent.canonical_model.model, None)
+        agent.instruction = "" if cache_name else SYSTEM_INSTRUCTION
+        agent.generate_content_config.cached_content = cache_name
+
+    def _select_runner(self, state: TransferState, user_message: str) -> Runner:
+        """
+        Flash once the transfer is close to complete (the turns that summarize
+        the details or handle the confirmation), Flash-Lite while the fields
+        are still being collected. Fields the message appears to provide
+        count as filled, so a message carrying several details at once (e.g.
+        "USA, 100 USD, John Smith, cash pickup") also goes to Flash.
+        """
+        filled = sum(
+            value is not None
+            for value in (
+                state.destinationCountry,
+                state.amount,
+                state.beneficiaryName,
+                state.deliveryMethod,
+            )
+        )
+        filled += sum(
+            value is None and pattern.search(user_message) is not None
+            for value, pattern in (
+                (state.destinationCountry, _COUNTRY_HINT_RE),
+                (state.amount, _AMOUNT_HINT_RE),
+                (state.deliveryMethod, _METHOD_HINT_RE),
+            )
+        )
+        return self._runner_flash if filled >= FLASH_MIN_FILLED_FIELDS else self._runner_lite
+
+    async def _get_or_create_session(self, session_id: str) -> Session:
         session = await self._session_service.get_session(
             app_name=self._app_name,
             user_id=self._user_id,
             session_id=session_id,
         )
-        # If not found, create and fetch again
         if session is None:
-            await self._session_service.create_session(
+            # create_session already returns the new session
+            session = await self._session_service.create_session(
                 app_name=self._app_name,
                 user_id=self._user_id,
                 session_id=session_id,
             )
+        return session
+
+    def _fast_path(
+        self,
+        payload: ChatRequest,
+        current_state: TransferState,
+    ) -> Optional[AgentResponse]:
+        """Answer trivial intents (reset, bare confirmation, greeting) without the LLM."""
+        intent = detect_intent(payload.userMessage, current_state)
+        if intent is None:
+            return None
+
+        if intent.kind == "reset":
+            return AgentResponse(
+                agentResponse=RESET_REPLIES[intent.language],
+                updatedState=TransferState(),
+            )
+        if intent.kind == "confirm":
+            return AgentResponse(
+                agentResponse=CONFIRM_REPLIES[intent.language].format(
+                    amount=current_state.amount,
+                    beneficiaryName=current_state.beneficiaryName,
+                ),
+                updatedState=current_state,
+                promo=PROMO_BY_LANG[intent.language],
+            )
+        return AgentResponse(
+            agentResponse=GREETING_REPLIES[intent.language],
+            updatedState=current_state,
+        )
+
+    async def _commit_response(self, session: Session, response: AgentResponse) -> None:
+        """Write a response produced without running the agent to session.state."""
+        await self._session_service.append_event(
+            session,
+            Event(
+                author=AGENT_NAME,
+                actions=EventActions(state_delta=response_state_delta(response)),
+            ),
+        )
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _cache_response(self, cache_key: str, response: AgentResponse) -> None:
+        try:
+            await self._response_cache.set(cache_key, response)
+        except Exception as e:
+            logger.warning("Could not cache agent response: %s", e)
+
+    async def _record_turn(
+        self,
+        session: Session,
+        payload: ChatRequest,
+        response: AgentResponse,
+    ) -> None:
+        rolled_off = await self._history.append(
+            session.id,
+            format_message("user", payload.userMessage),
+            format_message("agent", response.agentResponse),
+        )
+        if not rolled_off:
+            return
+        # Off the critical path: the reply does not wait for the summary.
+        # Summaries of a session are chained so each one builds on the last.
+        session_id = session.id
+        previous = self._summary_tasks.get(session_id)
+        task = self._spawn(self._summarize(session_id, rolled_off, previous))
+        self._summary_tasks[session_id] = task
+
+        def forget(done: asyncio.Task[None]) -> None:
+            if self._summary_tasks.get(session_id) is done:
+                del self._summary_tasks[session_id]
+
+        task.add_done_callback(forget)
+
+    async def _summarize(
+        self,
+        session_id: str,
+        rolled_off: List[str],
+        previous: Optional[asyncio.Task[None]],
+    ) -> None:
+        """
+        Fold messages that left the history window into the session summary.
+        Waits for the session's previous summary task and re-reads the summary
+        it wrote, rather than using the request's snapshot of session.state.
+        """
+        if previous is not None:
+            await asyncio.wait([previous])
+        try:
             session = await self._session_service.get_session(
                 app_name=self._app_name,
                 user_id=self._user_id,
                 session_id=session_id,
             )
-        if session is None:
-            raise RuntimeError("Could not create or retrieve session.")
+            if session is None:
+                return
+            prompt = SUMMARY_PROMPT.format(
+                summary=session.state.get(SUMMARY_STATE_KEY) or "None",
+                messages="\n".join(rolled_off),
+            )
+            result = await get_genai_client().aio.models.generate_content(
+                model=SUMMARY_MODEL_NAME,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.0,
+                    max_output_tokens=SUMMARY_MAX_OUTPUT_TOKENS,
+                ),
+            )
+            summary = (result.text or "").strip()
+            if summary:
+                await self._session_service.append_event(
+                    session,
+                    Event(
+                        author=AGENT_NAME,
+                        actions=EventActions(state_delta={SUMMARY_STATE_KEY: summary}),
+                    ),
+                )
+        except Exception as e:
+            logger.warning("Could not summarize conversation history: %s", e)
+
+    async def process_message(
+        self, 
+        payload: ChatRequest,
+        session_id: Optional[str] = None,
+        deltas: Optional[asyncio.Queue[Optional[str]]] = None,
+    ) -> AgentResponse:
+        """
+        Process a user message.
+        
+        Args:
+            payload: Request data
+            session_id: Session ID (if None, creates new session)
+            deltas: If given, the model output is streamed and each new piece
+                of 'agentResponse' text is put on this queue as it is generated
+        """
+        # Use provided session_id or create new one
+        if session_id is None:
+            session_id = secrets.token_hex(16)
+        
+        # History is only needed past the fast path, but fetching it alongside
+        # the session keeps it off the critical path
+        session, history = await asyncio.gather(
+            self._get_or_create_session(session_id),
+            self._history.get(session_id),
+        )
         
         # Retrieve current state from session.state (if exists)
-        # ADK is the single source of truth for the state
-        current_state = TransferState(
+        # ADK is the single source of truth for the state; it was validated
+        # when the callback stored it, so skip re-validation
+        current_state = TransferState.model_construct(
             destinationCountry=session.state.get("transfer:destinationCountry"),
             amount=session.state.get("transfer:amount"),
             beneficiaryName=session.state.get("transfer:beneficiaryName"),
@@ -232,69 +644,103 @@ class SendMoneyAgentService:
             isComplete=session.state.get("transfer:isComplete", False),
         )
         
+        fast_response = self._fast_path(payload, current_state)
+        if fast_response is not None:
+            await asyncio.gather(
+                self._commit_response(session, fast_response),
+                self._record_turn(session, payload, fast_response),
+            )
+            return fast_response
+
         # Prepare prompt context
         prompt = PromptContext(
             user_message=payload.userMessage,
             state=current_state,
-            history=payload.messageHistory,
+            history=history,
+            summary=session.state.get(SUMMARY_STATE_KEY),
         ).render()
 
+        # Keyed on everything the model sees, so a response is never reused
+        # for a conversation with different history or summary
+        cache_key = ResponseCache.key(prompt)
+        cached = await self._response_cache.get(cache_key)
+        if cached is not None:
+            await asyncio.gather(
+                self._commit_response(session, cached),
+                self._record_turn(session, payload, cached),
+            )
+            return cached
+
+        # A request with the identical prompt (same state, history, summary
+        # and message) already waiting on the LLM: share its result instead
+        # of starting another call
+        shared = self._inflight.get(cache_key)
+        if shared is not None:
+            response = await asyncio.shield(shared)
+            if response is not None:
+                await asyncio.gather(
+                    self._commit_response(session, response),
+                    self._record_turn(session, payload, response),
+                )
+                return response
+
+        leader: asyncio.Future[Optional[AgentResponse]] = asyncio.get_running_loop().create_future()
+        self._inflight.setdefault(cache_key, leader)
+        response = None
+        try:
+            response = await self._run_agent(
+                self._select_runner(current_state, payload.userMessage),
+                session_id,
+                prompt,
+                deltas,
+            )
+        finally:
+            # None tells waiting requests to make their own call
+            leader.set_result(response)
+            if self._inflight.get(cache_key) is leader:
+                del self._inflight[cache_key]
+
+        await self._record_turn(session, payload, response)
+        self._spawn(self._cache_response(cache_key, response))
+        return response
+
+    async def _run_agent(
+        self,
+        runner: Runner,
+        session_id: str,
+        prompt: str,
+        deltas: Optional[asyncio.Queue[Optional[str]]],
+    ) -> AgentResponse:
         content = types.Content(role="user", parts=[types.Part(text=prompt)])
         
-        runner = Runner(
-            agent=self._agent,
-            app_name=self._app_name,
-            session_service=self._session_service,
+        stream = AgentResponseStream() if deltas is not None else None
+        run_config = RunConfig(
+            streaming_mode=StreamingMode.SSE if stream else StreamingMode.NONE,
         )
 
-        final_text: Optional[str] = None
-        async for event in runner.run_async(
-            user_id=self._user_id,
-            session_id=session_id,
-            new_message=content,
-        ):
-            if event.is_final_response() and event.content and event.content.parts:
-                final_text = "".join(
-                    part.text or "" for part in event.content.parts if part.text
-                )
-
-        if not final_text:
+        response_future: asyncio.Future[AgentResponse] = asyncio.get_running_loop().create_future()
+        pending_token = _pending_response.set(response_future)
+        try:
+            async for event in runner.run_async(
+                user_id=self._user_id,
+                session_id=session_id,
+                new_message=content,
+                run_config=run_config,
+            ):
+                if stream and event.partial and event.content and event.content.parts:
+                    delta = stream.feed(
+                        "".join(part.text or "" for part in event.content.parts if part.text)
+                    )
+                    if delta:
+                        deltas.put_nowait(delta)
+        finally:
+            _pending_response.reset(pending_token)
+
+        if not response_future.done():
             raise RuntimeError("Agent did not return a final response.")
 
-        # Parse response
-        try:
-            data = json.loads(final_text)
-            response = AgentResponse(**data)
-        except Exception as e:
-            print(f"Error parsing agent response: {e}")
-            print(f"Response text: {final_text[:500]}")
-            raise
-        
-        # Retrieve updated state from session.state (after callback)
-        updated_session = await self._session_service.get_session(
-            app_name=self._app_name,
-            user_id=self._user_id,
-            session_id=session_id,
-        )
-        
-        # Update response.updatedState with ADK state
-        response.updatedState = TransferState(
-            destinationCountry=updated_session.state.get("transfer:destinationCountry"),
-            amount=updated_session.state.get("transfer:amount"),
-            beneficiaryName=updated_session.state.get("transfer:beneficiaryName"),
-            deliveryMethod=updated_session.state.get("transfer:deliveryMethod"),
-            isComplete=updated_session.state.get("transfer:isComplete", False),
-        )
-        
-        # Retrieve promo from state if exists
-        promo_json = updated_session.state.get("transfer:promo")
-        if promo_json:
-            try:
-                response.promo = PromoData(**json.loads(promo_json))
-            except Exception:
-                pass
-        
-        return response
+        # The callback already parsed the response and wrote it to session.state
+        return await response_future
 
 
 agent_service = SendMoneyAgentService()
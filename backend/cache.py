@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from .types import AgentResponse
+
+CACHE_KEY_PREFIX = "felix:cache:"
+
+
+class ResponseCache:
+    """
+    Exact-match cache of agent responses keyed on the rendered prompt (state,
+    recent history, summary and user message). A response is only reused
+    for a conversation that gives the model exactly the same input.
+
+    Disabled (every lookup misses) when no Redis client is configured.
+    """
+
+    def __init__(self, redis: Optional[Redis], ttl_seconds: int) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key(prompt: str) -> str:
+        return CACHE_KEY_PREFIX + blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+    async def get(self, key: str) -> Optional[AgentResponse]:
+        if self._redis is None:
+            return None
+        cached = await self._redis.get(key)
+        if cached is None:
+            return None
+        return AgentResponse.model_validate_json(cached)
+
+    async def set(self, key: str, response: AgentResponse) -> None:
+        if self._redis is None:
+            return
+        await self._redis.setex(key, self._ttl_seconds, response.model_dump_json())
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from typing import Deque, List
+
+from redis.asyncio import Redis
+
+HISTORY_KEY_PREFIX = "felix:history:"
+# Number of most recent messages included verbatim in the prompt; older
+# messages roll off into a summary
+HISTORY_WINDOW = 4
+# Sessions kept by the in-memory store (least recently used evicted)
+IN_MEMORY_HISTORY_SESSIONS = 1024
+
+
+def format_message(role: str, content: str) -> str:
+    return f"{role.upper()}: {content}"
+
+
+class RedisHistoryStore:
+    """
+    Server-side conversation history: pre-formatted "ROLE: content" lines in
+    a Redis list (felix:history:{session_id}), newest first, capped at
+    HISTORY_WINDOW entries. append returns the lines that rolled off.
+    """
+
+    def __init__(self, redis: Redis, ttl_seconds: int) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"{HISTORY_KEY_PREFIX}{session_id}"
+
+    async def get(self, session_id: str) -> List[str]:
+        """Lines of the session's recent messages, oldest first."""
+        lines = await self._redis.lrange(self._key(session_id), 0, HISTORY_WINDOW - 1)
+        lines.reverse()
+        return lines
+
+    async def append(self, session_id: str, *lines: str) -> List[str]:
+        """Add lines and return those that fell out of the window, oldest first."""
+        key = self._key(session_id)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.lpush(key, *lines)
+        pipe.lrange(key, HISTORY_WINDOW, -1)
+        pipe.ltrim(key, 0, HISTORY_WINDOW - 1)
+        pipe.expire(key, self._ttl_seconds)
+        _, rolled_off, _, _ = await pipe.execute()
+        rolled_off.reverse()
+        return rolled_off
+
+
+class InMemoryHistoryStore:
+    """Process-local equivalent of RedisHistoryStore, used without REDIS_URL."""
+
+    def __init__(self) -> None:
+        self._sessions: OrderedDict[str, Deque[str]] = OrderedDict()
+
+    async def get(self, session_id: str) -> List[str]:
+        lines = self._sessions.get(session_id)
+        if lines is None:
+            return []
+        self._sessions.move_to_end(session_id)
+        return list(lines)
+
+    async def append(self, session_id: str, *lines: str) -> List[str]:
+        history = self._sessions.get(session_id)
+        if history is None:
+            history = self._sessions[session_id] = deque(maxlen=HISTORY_WINDOW)
+            if len(self._sessions) > IN_MEMORY_HISTORY_SESSIONS:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+        overflow = max(0, len(history) + len(lines) - HISTORY_WINDOW)
+        rolled_off = [*history, *lines][:overflow]
+        history.extend(lines)
+        return rolled_off
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import re
+from typing import NamedTuple, Optional
+
+from .types import TransferState
+
+# Phrases recognized without the LLM, mapped to the language they identify.
+# None marks phrases shared by several languages: those still go to the LLM,
+# which picks the reply language from context.
+RESET_PHRASES: dict[str, Optional[str]] = {
+    "reset": "en",
+    "restart": "en",
+    "start over": "en",
+    "cancel": "en",
+    "recomeçar": "pt",
+    "começar de novo": "pt",
+    "empezar de nuevo": "es",
+    "cancelar": None,
+    "reiniciar": None,
+}
+
+CONFIRM_PHRASES: dict[str, Optional[str]] = {
+    "yes": "en",
+    "yeah": "en",
+    "yep": "en",
+    "confirm": "en",
+    "send": "en",
+    "correct": "en",
+    "sim": "pt",
+    "correto": "pt",
+    "sí": "es",
+    "si": "es",
+    "correcto": "es",
+    "ok": None,
+    "okay": None,
+    "enviar": None,
+    "confirmo": None,
+    "claro": None,
+}
+
+GREETING_PHRASES: dict[str, Optional[str]] = {
+    "hi": "en",
+    "hello": "en",
+    "hey": "en",
+    "oi": "pt",
+    "olá": "pt",
+    "hola": "es",
+}
+
+
+def _phrase_re(phrases: dict[str, Optional[str]]) -> re.Pattern[str]:
+    alternatives = "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
+    return re.compile(rf"^\s*({alternatives})\b", re.IGNORECASE)
+
+
+RESET_RE = _phrase_re(RESET_PHRASES)
+# Messages that (start by) confirming a completed transfer
+CONFIRM_RE = _phrase_re(CONFIRM_PHRASES)
+GREETING_RE = _phrase_re(GREETING_PHRASES)
+# What may follow a phrase for the message to still consist solely of it
+_TRAILER_RE = re.compile(r"[\s.!]*")
+
+
+class Intent(NamedTuple):
+    kind: str  # "reset" | "confirm" | "greeting"
+    language: str
+
+
+def _whole_message_language(
+    pattern: re.Pattern[str],
+    phrases: dict[str, Optional[str]],
+    message: str,
+) -> Optional[str]:
+    match = pattern.match(message)
+    if not match or not _TRAILER_RE.fullmatch(message, match.end()):
+        return None
+    return phrases[match.group(1).lower()]
+
+
+def detect_intent(message: str, state: TransferState) -> Optional[Intent]:
+    """
+    Trivial intents that can be answered without the LLM: an explicit reset,
+    a bare confirmation of a complete transfer, or a greeting before anything
+    was collected. Only unambiguous, whole-message matches count.
+    """
+    language = _whole_message_language(RESET_RE, RESET_PHRASES, message)
+    if language:
+        return Intent("reset", language)
+
+    if state.isComplete:
+        language = _whole_message_language(CONFIRM_RE, CONFIRM_PHRASES, message)
+        if language:
+            return Intent("confirm", language)
+
+    if state == TransferState():
+        language = _whole_message_language(GREETING_RE, GREETING_PHRASES, message)
+        if language:
+            return Intent("greeting", language)
+
+    return None
+
+
+RESET_REPLIES = {
+    "en": "No problem, let's start over. Which country would you like to send money to?",
+    "pt": "Sem problemas, vamos recomeçar. Para qual país você gostaria de enviar dinheiro?",
+    "es": "No hay problema, empecemos de nuevo. ¿A qué país te gustaría enviar dinero?",
+}
+
+GREETING_REPLIES = {
+    "en": "Hi! I'm your Send Money Assistant. Which country would you like to send money to?",
+    "pt": "Olá! Sou seu Assistente de Envio de Dinheiro. Para qual país você gostaria de enviar dinheiro?",
+    "es": "¡Hola! Soy tu Asistente de Envío de Dinero. ¿A qué país te gustaría enviar dinero?",
+}
+
+CONFIRM_REPLIES = {
+    "en": "Great! Your transfer of {amount} to {beneficiaryName} is being processed. Thank you for using our service!",
+    "pt": "Perfeito! Sua transferência de {amount} para {beneficiaryName} está sendo processada. Obrigado por usar nosso serviço!",
+    "es": "¡Perfecto! Tu transferencia de {amount} a {beneficiaryName} se está procesando. ¡Gracias por usar nuestro servicio!",
+}
@@ -1,52 +1,81 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Any, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.middleware.cors import CORSMiddleware
-
-from .agent import agent_service
-from .types import AgentResponse, ChatRequest
+from fastapi import FastAPI, Query
+from fastapi.responses import StreamingResponse
 
+# Load .env before importing the agent, which reads its settings at import time
 load_dotenv()
 
+from .agent import agent_service  # noqa: E402
+from .middleware import StaticCORSMiddleware  # noqa: E402
+from .types import AgentResponse, ChatRequest  # noqa: E402
+
 logger = logging.getLogger("send_money_agent")
 
-app = FastAPI(title="Send Money Agent Service")
 
-allowed_origins = os.getenv("ALLOWED_ORIGINS", "*").split(",")
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    await agent_service.start()
+    try:
+        yield
+    finally:
+        await agent_service.stop()
+
+
+app = FastAPI(title="Send Money Agent Service", lifespan=lifespan)
+
+allowed_origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+app.add_middleware(StaticCORSMiddleware, allow_origins=allowed_origins)
+
+
+def _ndjson(event: dict[str, Any]) -> bytes:
+    return orjson.dumps(event) + b"\n"
+
+
+async def _stream_events(
+    task: asyncio.Task[AgentResponse],
+    deltas: asyncio.Queue[Optional[str]],
+) -> AsyncIterator[bytes]:
+    try:
+        while (delta := await deltas.get()) is not None:
+            yield _ndjson({"type": "delta", "text": delta})
+        try:
+            response = task.result()
+        except Exception as exc:  # pragma: no cover - logging path
+            logger.exception("Agent processing failed: %s", exc)
+            yield _ndjson({"type": "error", "detail": f"Agent processing error: {str(exc)}"})
+            return
+        yield _ndjson({"type": "final", **response.model_dump(mode="json")})
+    finally:
+        # Client went away before the agent finished
+        task.cancel()
 
 
 @app.post("/api/chat")
 async def chat_endpoint(
     request: ChatRequest,
     session_id: Optional[str] = Query(None, description="Session ID to maintain context")
-) -> Any:
-    try:
-        response: AgentResponse = await agent_service.process_message(
-            request, 
-            session_id=session_id
-        )
-        return response.model_dump()
-    except HTTPException:
-        raise
-    except Exception as exc:  # pragma: no cover - logging path
-        import traceback
-        logger.exception("Agent processing failed: %s", exc)
-        logger.error("Full traceback: %s", traceback.format_exc())
-        raise HTTPException(
-            status_code=500,
-            detail=f"Agent processing error: {str(exc)}",
-        ) from exc
-
-
+) -> StreamingResponse:
+    """
+    Streams newline-delimited JSON events: "delta" events carry the
+    agentResponse text as it is generated, followed by a single "final" event
+    with the full AgentResponse (or an "error" event).
+    """
+    deltas: asyncio.Queue[Optional[str]] = asyncio.Queue()
+    task = asyncio.create_task(
+        agent_service.process_message(request, session_id=session_id, deltas=deltas)
+    )
+    # None marks the end of the delta stream
+    task.add_done_callback(lambda _: deltas.put_nowait(None))
+    return StreamingResponse(
+        _stream_events(task, deltas),
+        media_type="application/x-ndjson",
+    )
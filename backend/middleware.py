@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Headers = List[Tuple[bytes, bytes]]
+
+ALLOWED_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+PREFLIGHT_MAX_AGE = b"600"
+
+
+class StaticCORSMiddleware:
+    """
+    Pure ASGI CORS middleware with credentials allowed. All header values
+    except the echoed origin are built once at startup, so a request only
+    costs a set lookup of its Origin header. Being pure ASGI (no
+    BaseHTTPMiddleware), streamed responses pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str]) -> None:
+        self.app = app
+        origins = [origin.strip() for origin in allow_origins if origin.strip()]
+        self._allow_all = "*" in origins
+        self._origins = frozenset(origin.encode("latin-1") for origin in origins)
+        self._response_headers: Headers = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        self._preflight_headers: Headers = [
+            *self._response_headers,
+            (b"access-control-allow-methods", ALLOWED_METHODS),
+            (b"access-control-max-age", PREFLIGHT_MAX_AGE),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        requested_headers = None
+        is_preflight = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                is_preflight = True
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        if origin is None or not (self._allow_all or origin in self._origins):
+            await self.app(scope, receive, send)
+            return
+
+        allow_origin = (b"access-control-allow-origin", origin)
+        if is_preflight and scope["method"] == "OPTIONS":
+            headers = [allow_origin, *self._preflight_headers, (b"content-length", b"0")]
+            if requested_headers is not None:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    allow_origin,
+                    *self._response_headers,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from .types import PromoData
+
+PROMO_IMAGE_URL = "https://cdn.prod.website-files.com/663002023d3d42ffa6937084/692e0e7ee90ceebca6e1077c_home-troca.avif"
+PROMO_LINK = "https://www.felixpago.com"
+
+# Promo card content per language code (PromoData fields)
+PROMO_TRANSLATIONS: dict[str, dict[str, str]] = {
+    "en": {
+        "imageUrl": PROMO_IMAGE_URL,
+        "title": "Send money home and enter to win a Ford F-150 XL",
+        "description": "All your transfers in December of $100 or more enter the draw.",
+        "buttonText": "Send and participate now",
+        "link": PROMO_LINK,
+        "footer": "T&Cs apply. Promotion not valid for NY and FL.",
+    },
+    "pt": {
+        "imageUrl": PROMO_IMAGE_URL,
+        "title": "Envie dinheiro para casa e concorra a uma Ford F-150 XL",
+        "description": "Todas as suas transferências em dezembro de $100 ou mais participam do sorteio.",
+        "buttonText": "Enviar e participar agora",
+        "link": PROMO_LINK,
+        "footer": "Aplicam-se termos e condições. Promoção não válida para NY e FL.",
+    },
+    "es": {
+        "imageUrl": PROMO_IMAGE_URL,
+        "title": "Envía dinero a casa y participa para ganar una Ford F-150 XL",
+        "description": "Todas tus transferencias en diciembre de $100 o más participan en el sorteo.",
+        "buttonText": "Enviar y participar ahora",
+        "link": PROMO_LINK,
+        "footer": "Aplican términos y condiciones. Promoción no válida para NY y FL.",
+    },
+}
+
+# Built once at import: promo cards are attached to confirmations without
+# asking the LLM to translate them
+PROMO_BY_LANG: dict[str, PromoData] = {
+    language: PromoData(**fields) for language, fields in PROMO_TRANSLATIONS.items()
+}
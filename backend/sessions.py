@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import secrets
+import time
+from typing import Any, Optional
+
+import orjson
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, Session, State
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+from redis.asyncio import Redis
+
+SESSION_KEY_PREFIX = "felix:session:"
+# Hash field marking that the session exists even while its state is empty
+_CREATED_FIELD = "_created"
+
+
+class RedisSessionService(BaseSessionService):
+    """
+    Session service that keeps session.state in a Redis hash
+    (felix:session:{session_id}), so sessions survive restarts and are shared
+    between workers/replicas.
+
+    Only state is persisted: the agent runs with include_contents="none", so
+    the event log is never replayed to the model and is not stored.
+    """
+
+    def __init__(self, redis: Redis, ttl_seconds: int) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"{SESSION_KEY_PREFIX}{session_id}"
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session_id = session_id or secrets.token_hex(16)
+        now = time.time()
+        state = dict(state or {})
+
+        key = self._key(session_id)
+        mapping = {k: orjson.dumps(v) for k, v in state.items() if v is not None}
+        mapping[_CREATED_FIELD] = orjson.dumps(now)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, self._ttl_seconds)
+        await pipe.execute()
+
+        return Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=state,
+            last_update_time=now,
+        )
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        fields = await self._redis.hgetall(self._key(session_id))
+        if not fields:
+            return None
+
+        created = orjson.loads(fields.pop(_CREATED_FIELD, "0"))
+        return Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state={k: orjson.loads(v) for k, v in fields.items()},
+            last_update_time=created,
+        )
+
+    async def list_sessions(
+        self,
+        *,
+        app_name: str,
+        user_id: Optional[str] = None,
+    ) -> ListSessionsResponse:
+        sessions = []
+        async for key in self._redis.scan_iter(match=f"{SESSION_KEY_PREFIX}*"):
+            sessions.append(
+                Session(
+                    id=key[len(SESSION_KEY_PREFIX):],
+                    app_name=app_name,
+                    user_id=user_id or "",
+                )
+            )
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> None:
+        await self._redis.delete(self._key(session_id))
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        if event.partial:
+            return event
+        event = await super().append_event(session, event)
+
+        state_delta = {
+            k: v
+            for k, v in (event.actions.state_delta if event.actions else {}).items()
+            if not k.startswith(State.TEMP_PREFIX)
+        }
+        if not state_delta:
+            return event
+
+        # All fields written by the callback go out in a single round-trip.
+        # Cleared (None) fields are removed rather than stored, keeping the
+        # hash compact; get_session reads missing fields back as absent.
+        key = self._key(session.id)
+        updates = {k: orjson.dumps(v) for k, v in state_delta.items() if v is not None}
+        cleared = [k for k, v in state_delta.items() if v is None]
+        pipe = self._redis.pipeline(transaction=False)
+        if updates:
+            pipe.hset(key, mapping=updates)
+        if cleared:
+            pipe.hdel(key, *cleared)
+        pipe.expire(key, self._ttl_seconds)
+        await pipe.execute()
+        return event
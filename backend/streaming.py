@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Optional, Tuple
+
+_AGENT_RESPONSE_KEY = re.compile(r'"agentResponse"\s*:\s*"')
+_PLAIN_RUN = re.compile(r'[^"\\]+')
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class AgentResponseStream:
+    """
+    Incrementally extracts the 'agentResponse' string value from a JSON
+    document that arrives in chunks, so the reply text can be flushed to the
+    client before 'updatedState'/'promo' have been generated.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        # Index of the next undecoded character of the agentResponse value
+        self._pos: Optional[int] = None
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        """Append a chunk and return the newly decoded agentResponse text."""
+        self._buffer += chunk
+        if self._done:
+            return ""
+
+        if self._pos is None:
+            match = _AGENT_RESPONSE_KEY.search(self._buffer)
+            if not match:
+                return ""
+            self._pos = match.end()
+
+        buffer = self._buffer
+        pos = self._pos
+        decoded = []
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char == '"':
+                self._done = True
+                pos += 1
+                break
+            if char != "\\":
+                run = _PLAIN_RUN.match(buffer, pos)
+                decoded.append(run.group())
+                pos = run.end()
+                continue
+            escape = _decode_escape(buffer, pos)
+            if escape is None:
+                # Escape sequence split across chunks, wait for more input
+                break
+            text, pos = escape
+            decoded.append(text)
+
+        self._pos = pos
+        return "".join(decoded)
+
+
+def _decode_escape(buffer: str, pos: int) -> Optional[Tuple[str, int]]:
+    """Decode the escape sequence at buffer[pos]; None if it is incomplete."""
+    if pos + 1 >= len(buffer):
+        return None
+    kind = buffer[pos + 1]
+    if kind != "u":
+        return _SIMPLE_ESCAPES.get(kind, kind), pos + 2
+
+    end = pos + 6
+    if end > len(buffer):
+        return None
+    code = int(buffer[pos + 2:end], 16)
+    if 0xD800 <= code < 0xDC00:
+        # High surrogate: decode together with the following low surrogate
+        if end + 6 > len(buffer):
+            return None
+        if buffer[end:end + 2] == "\\u":
+            end += 6
+    return json.loads(f'"{buffer[pos:end]}"'), end
@@ -37,6 +37,16 @@ class AgentResponse(BaseModel):
     promo: Optional[PromoData] = None
 
 
+PromoLanguage = Literal["en", "pt", "es"]
+
+
+class AgentOutput(BaseModel):
+    """Structured output requested from the LLM; the promo is attached server-side."""
+    agentResponse: str
+    updatedState: TransferState
+    promoLanguage: Optional[PromoLanguage] = None
+
+
 VALID_COUNTRIES = [
     "USA",
     "Mexico",
@@ -73,6 +83,7 @@ COUNTRY_CURRENCY_MAP = {
 class ChatRequest(BaseModel):
     userMessage: str = Field(..., min_length=1)
     currentState: Optional[TransferState] = None
+    # Deprecated: history is kept server-side per session and this is ignored
     messageHistory: list[Message] = Field(default_factory=list)
 
 
@@ -9,7 +9,9 @@ APP_HOST="${HOST:-0.0.0.0}"
 export PYTHON_SERVICE_URL="${PYTHON_SERVICE_URL:-http://127.0.0.1:${PY_PORT}}"
 
 start_backend() {
-  python -m uvicorn backend.main:app --host 0.0.0.0 --port "${PY_PORT}"
+  # More than one worker requires REDIS_URL so sessions are shared
+  python -m uvicorn backend.main:app --host 0.0.0.0 --port "${PY_PORT}" \
+    --loop uvloop --http httptools --workers "${UVICORN_WORKERS:-1}"
 }
 
 start_frontend() {
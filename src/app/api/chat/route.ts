@@ -1,5 +1,4 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { Message } from '@/types';
 
 const PYTHON_SERVICE_URL =
   process.env.PYTHON_SERVICE_URL ||
@@ -9,7 +8,7 @@ const PYTHON_SERVICE_URL =
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
-    const { userMessage, messageHistory, sessionId } = body;
+    const { userMessage, sessionId } = body;
 
     // Validate required fields
     if (!userMessage || typeof userMessage !== 'string') {
@@ -19,12 +18,6 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Convert messageHistory timestamps from strings to Date objects if needed
-    const normalizedHistory: Message[] = (messageHistory || []).map((msg: Message) => ({
-      ...msg,
-      timestamp: msg.timestamp instanceof Date ? msg.timestamp : new Date(msg.timestamp),
-    }));
-
     // Build URL with session_id as query parameter
     const url = new URL(`${PYTHON_SERVICE_URL.replace(/\/$/, '')}/api/chat`);
     if (sessionId) {
@@ -36,10 +29,8 @@ export async function POST(request: NextRequest) {
       headers: {
         'Content-Type': 'application/json',
       },
-      body: JSON.stringify({
-        userMessage,
-        messageHistory: normalizedHistory,
-      }),
+      // Conversation history is kept server-side per session
+      body: JSON.stringify({ userMessage }),
     });
 
     if (!response.ok) {
@@ -50,9 +41,14 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    const data = await response.json();
-
-    return NextResponse.json(data);
+    // Pass the NDJSON event stream through so agentResponse text reaches the
+    // browser as soon as the model produces it
+    return new Response(response.body, {
+      headers: {
+        'Content-Type': 'application/x-ndjson',
+        'Cache-Control': 'no-cache',
+      },
+    });
   } catch (error) {
     console.error('API Error:', error);
     return NextResponse.json(
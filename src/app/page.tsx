@@ -1,7 +1,7 @@
 'use client';
 
 import React, { useState, useRef, useEffect } from 'react';
-import { TransferState, Message } from '@/types';
+import { AgentResponse, TransferState, Message } from '@/types';
 import StatePanel from '@/components/StatePanel';
 import ChatBubble from '@/components/ChatBubble';
 import { Send, Menu, X, Wallet, RefreshCw } from 'lucide-react';
@@ -26,6 +26,9 @@ export default function Home() {
   const [transferState, setTransferState] = useState<TransferState>(INITIAL_STATE);
   const [inputValue, setInputValue] = useState('');
   const [isLoading, setIsLoading] = useState(false);
+  // True once reply text is arriving; only hides the typing indicator, input
+  // stays locked (isLoading) until the full response has been received
+  const [isStreaming, setIsStreaming] = useState(false);
   const [isMobileMenuOpen, setIsMobileMenuOpen] = useState(false);
   // Manages session_id - always generates new one on each page load
   // This ensures state is cleared when user reloads
@@ -75,6 +78,8 @@ export default function Home() {
     setMessages(newHistory);
     setIsLoading(true);
 
+    const agentMsgId = (Date.now() + 1).toString();
+
     try {
       const response = await fetch('/api/chat', {
         method: 'POST',
@@ -83,35 +88,72 @@ export default function Home() {
         },
         body: JSON.stringify({
           userMessage: userText,
-          messageHistory: newHistory,
-          sessionId: sessionId, // Send session_id to reuse session
+          sessionId: sessionId, // Send session_id to reuse session (history lives server-side)
         }),
       });
 
-      if (!response.ok) {
+      if (!response.ok || !response.body) {
         throw new Error('Failed to get response from server');
       }
 
-      const data = await response.json();
-      
+      let streamedText = '';
+      let data: AgentResponse | null = null;
+
+      // The backend streams NDJSON events: "delta" chunks of agentResponse text,
+      // then a single "final" event with the full response (or an "error")
+      const handleEvent = (line: string) => {
+        if (!line.trim()) return;
+        const event = JSON.parse(line);
+        if (event.type === 'delta') {
+          streamedText += event.text;
+          const partialMsg: Message = {
+            id: agentMsgId,
+            role: 'agent',
+            content: streamedText,
+            timestamp: new Date(),
+          };
+          setIsStreaming(true);
+          setMessages(prev => [...prev.filter(msg => msg.id !== agentMsgId), partialMsg]);
+        } else if (event.type === 'final') {
+          data = event;
+        } else if (event.type === 'error') {
+          throw new Error(event.detail || 'Agent processing error');
+        }
+      };
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffered = '';
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffered += decoder.decode(value, { stream: true });
+        const lines = buffered.split('\n');
+        buffered = lines.pop() ?? '';
+        lines.forEach(handleEvent);
+      }
+      handleEvent(buffered + decoder.decode());
+
+      const finalData = data as AgentResponse | null;
+
       // Debug: verify response structure
-      console.log('Response data:', data);
+      console.log('Response data:', finalData);
       
-      if (!data.agentResponse) {
-        console.error('Missing agentResponse in data:', data);
+      if (!finalData?.agentResponse) {
+        console.error('Missing agentResponse in data:', finalData);
         throw new Error('Invalid response format: missing agentResponse');
       }
       
       const agentMsg: Message = {
-        id: (Date.now() + 1).toString(),
+        id: agentMsgId,
         role: 'agent',
-        content: data.agentResponse,
+        content: finalData.agentResponse,
         timestamp: new Date(),
-        promo: data.promo || undefined,
+        promo: finalData.promo || undefined,
       };
 
-      setMessages(prev => [...prev, agentMsg]);
-      setTransferState(data.updatedState || transferState);
+      setMessages(prev => [...prev.filter(msg => msg.id !== agentMsgId), agentMsg]);
+      setTransferState(finalData.updatedState || transferState);
     } catch (error) {
       console.error("Error processing message:", error);
       const errorMsg: Message = {
@@ -120,9 +162,11 @@ export default function Home() {
         content: "I'm having trouble connecting right now. Please try again in a moment.",
         timestamp: new Date(),
       };
-      setMessages(prev => [...prev, errorMsg]);
+      // Drop any half-streamed reply before showing the error
+      setMessages(prev => [...prev.filter(msg => msg.id !== agentMsgId), errorMsg]);
     } finally {
       setIsLoading(false);
+      setIsStreaming(false);
     }
   };
 
@@ -195,7 +239,7 @@ export default function Home() {
             ))}
             
             {/* Loading Indicator */}
-            {isLoading && (
+            {isLoading && !isStreaming && (
               <div className="flex justify-start w-full mb-6">
                  <div className="flex items-center space-x-2 bg-white px-4 py-3 rounded-2xl rounded-tl-none border border-slate-100 shadow-sm ml-11">
                     <div className="w-2 h-2 bg-blue-400 rounded-full animate-bounce" style={{ animationDelay: '0ms' }} />